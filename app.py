@@ -3,7 +3,7 @@ import pandas as pd
 
 from auth import authenticate, get_auth_url, reset_session
 from api import HighLevelDeliverer
-from utils import AuthError, columnComplier
+from utils import AuthError, columnComplier, exportDataFrame, EXPORT_FORMATS
 
 
 # Define global variables for column mappings
@@ -62,6 +62,17 @@ def convertHighLevel(df):
     return df
 
 
+def buildExport(df, file_id, file_format):
+    # Kept per session and keyed on the upload so reruns don't re-encode the whole file
+    key = (file_id, file_format)
+    cached = st.session_state.get("export")
+
+    if cached is None or cached[0] != key:
+        st.session_state["export"] = (key, exportDataFrame(df, file_format))
+
+    return st.session_state["export"][1]
+
+
 def main():
     """
     Converts Couchdrop to GoHighLevel format
@@ -117,13 +128,21 @@ def main():
             # -- Download CSV --
 
             if option == "Download CSV":
-                csv = df.to_csv(index=False).encode('utf-8')
-                st.download_button(
-                    label="Download converted CSV",
-                    data=csv,
-                    file_name='converted_file.csv',
-                    mime='text/csv',
-                )
+                file_format = st.selectbox("File format", list(EXPORT_FORMATS.keys()))
+                export = EXPORT_FORMATS[file_format]
+
+                try:
+                    with st.spinner("Preparing download..."):
+                        data = buildExport(df, uploaded_file.file_id, file_format)
+
+                    st.download_button(
+                        label=f"Download converted {file_format}",
+                        data=data,
+                        file_name=f"converted_file.{export['extension']}",
+                        mime=export['mime'],
+                    )
+                except Exception as e:
+                    st.error(e)
                 
             # -- Send to GoHighLevel --
             
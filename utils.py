@@ -1,4 +1,4 @@
-import requests, time, random
+import requests, time, random, io, gzip
 import pandas as pd
 from functools import wraps
 
@@ -91,4 +91,50 @@ def columnComplier(df):
 
     df_copy.rename(columns={'Email 2': 'Additional email addresses', 'Phone 2': 'Additional phone numbers'}, inplace=True)
 
-    return df_copy
\ No newline at end of file
+    return df_copy
+
+
+EXPORT_FORMATS = {
+    "CSV": {"extension": "csv", "mime": "text/csv"},
+    "Gzipped CSV": {"extension": "csv.gz", "mime": "application/gzip"},
+    "Parquet": {"extension": "parquet", "mime": "application/vnd.apache.parquet"},
+}
+
+
+def exportDataFrame(df, file_format="CSV", chunksize=50_000):
+    """
+    Serialize a dataframe to bytes in one of the EXPORT_FORMATS
+
+    CSV output is encoded in chunks of rows straight into a binary buffer
+    (optionally through gzip), so the full CSV string is never built in memory.
+    """
+    if file_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format: {file_format}")
+
+    buffer = io.BytesIO()
+
+    if file_format == "Parquet":
+        # Object columns from read_csv can mix ints and strings, which pyarrow rejects
+        df = df.astype({c: "string" for c in df.select_dtypes("object")})
+        df.to_parquet(buffer, index=False)
+        return buffer.getvalue()
+
+    if file_format == "Gzipped CSV":
+        # mtime=0 so identical data gives identical bytes
+        stream = gzip.GzipFile(fileobj=buffer, mode="wb", mtime=0)
+    else:
+        stream = buffer
+
+    try:
+        text = io.TextIOWrapper(stream, encoding="utf-8", newline="")
+        try:
+            df.to_csv(text, index=False, chunksize=chunksize)
+            text.flush()
+        finally:
+            # Detach so closing the wrapper doesn't close the underlying buffer
+            text.detach()
+    finally:
+        if stream is not buffer:
+            stream.close()
+
+    return buffer.getvalue()